@@ -1,3 +1,4 @@
+from functools import lru_cache
 from mage_ai.data_cleaner.column_types.constants import NUMBER_TYPES, ColumnType
 from mage_ai.data_cleaner.transformer_actions.constants import CURRENCY_SYMBOLS
 from mage_ai.shared.custom_types import FrozenDict
@@ -65,6 +66,7 @@ def clean_dataframe(df, column_types, dropna=True):
     return df.apply(lambda col: clean_series(col, column_types[col.name], dropna=dropna))
 
 
+@lru_cache(maxsize=4096)
 def clean_name(name):
     for c in ['\ufeff', '\uFEFF', '"', '$', '\n', '\r', '\t']:
         name = name.replace(c, '')
@@ -0,0 +1,164 @@
+from collections import defaultdict
+from enum import Enum
+from functools import lru_cache
+from pandas import DataFrame, Series
+from pandas.api.types import infer_dtype, is_object_dtype, is_string_dtype
+from typing import Callable, Collection, Dict, List, Mapping, Optional
+import numpy as np
+import pandas as pd
+
+STRING_SAMPLE_SIZE = 10
+
+
+class PandasTypes(str, Enum):
+    """
+    Data types returned by `pandas.api.types.infer_dtype`.
+    """
+
+    BOOLEAN = 'boolean'
+    BYTES = 'bytes'
+    CATEGORICAL = 'categorical'
+    COMPLEX = 'complex'
+    DATE = 'date'
+    DATETIME = 'datetime'
+    DATETIME64 = 'datetime64'
+    DECIMAL = 'decimal'
+    EMPTY = 'empty'
+    FLOATING = 'floating'
+    INTEGER = 'integer'
+    INTERVAL = 'interval'
+    MIXED = 'mixed'
+    MIXED_INTEGER = 'mixed-integer'
+    MIXED_INTEGER_FLOAT = 'mixed-integer-float'
+    PERIOD = 'period'
+    STRING = 'string'
+    TIME = 'time'
+    TIMEDELTA = 'timedelta'
+    TIMEDELTA64 = 'timedelta64'
+    UNKNOWN_ARRAY = 'unknown-array'
+
+
+class LazyDtypes(dict):
+    """
+    Mapping from column name to inferred data type like the one returned by `infer_dtypes`,
+    except that the data type of each column is only inferred the first time it is looked up.
+    Iterating over the mapping only yields the columns which have already been looked up.
+    """
+
+    def __init__(self, df: DataFrame) -> None:
+        """
+        Args:
+            df (DataFrame): Data frame to infer column data types for.
+        """
+        super().__init__()
+        self.df = df
+
+    def __missing__(self, column: str) -> str:
+        dtype = self[column] = _infer_column_dtype(self.df[column])
+        return dtype
+
+
+def clean_df_for_export(
+    df: DataFrame,
+    column_mapper: Callable[[DataFrame, str], DataFrame],
+    dtypes: Mapping[str, str],
+    dtypes_to_clean: Optional[Collection[str]] = None,
+) -> DataFrame:
+    """
+    Cleans the data frame so that each column can be exported to the target data source.
+    Columns are grouped by their inferred data type so that each group is cleaned at once.
+
+    Args:
+        df (DataFrame): Data frame to clean.
+        column_mapper (Callable[[DataFrame, str], DataFrame]): Function applied to each group of
+        columns along with their shared inferred data type. Returns the cleaned columns.
+        dtypes (Mapping[str, str]): Inferred data type of each column.
+        dtypes_to_clean (Collection[str], Optional): Data types of the columns changed by
+        `column_mapper`. Columns of any other data type are not passed to `column_mapper` and
+        share their data with the input data frame. Defaults to None, which cleans all columns.
+
+    Returns:
+        DataFrame: Cleaned shallow copy of the data frame.
+    """
+    buckets: Dict[str, List[str]] = defaultdict(list)
+    for column, dtype in dtypes.items():
+        if dtypes_to_clean is None or dtype in dtypes_to_clean:
+            buckets[dtype].append(column)
+    cleaned_columns = {}
+    for dtype, columns in buckets.items():
+        cleaned_columns.update(column_mapper(df[columns], dtype).items())
+    if not cleaned_columns:
+        return df.copy(deep=False)
+    # The cleaned data frame is built at once rather than assigning each cleaned column, which
+    # rebuilds the blocks of the data frame on every assignment
+    copy_df = DataFrame(
+        {
+            position: cleaned_columns[column] if column in cleaned_columns else values
+            for position, (column, values) in enumerate(df.items())
+        },
+        index=df.index,
+        copy=False,
+    )
+    copy_df.columns = df.columns
+    return copy_df
+
+
+def infer_dtypes(df: DataFrame) -> Mapping[str, str]:
+    """
+    Infers the data type of each column in the data frame, skipping null values.
+
+    The data type of columns backed by a non-object NumPy array is determined by the type of the
+    array alone, so these columns are never scanned. Object columns whose leading values are all
+    strings are assumed to be string columns without scanning the rest of the column.
+
+    Args:
+        df (DataFrame): Data frame to infer column data types for.
+
+    Returns:
+        Mapping[str, str]: Mapping from column name to inferred data type.
+    """
+    return {column: _infer_column_dtype(df[column]) for column in df.columns}
+
+
+def _infer_column_dtype(column: Series) -> str:
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind != 'O':
+        return _infer_numpy_dtype(dtype.str)
+    elif is_object_dtype(dtype) or is_string_dtype(dtype):
+        sample = column.head(STRING_SAMPLE_SIZE).dropna()
+        if len(sample) and all(isinstance(value, str) for value in sample):
+            return PandasTypes.STRING
+    return infer_dtype(column, skipna=True)
+
+
+@lru_cache(maxsize=128)
+def _infer_numpy_dtype(dtype: str) -> str:
+    return infer_dtype(np.empty(0, dtype=dtype))
+
+
+def reset_index_shallow(df: DataFrame) -> DataFrame:
+    """
+    Moves the index of the data frame into its columns, like `DataFrame.reset_index`. Unlike
+    `DataFrame.reset_index`, the existing columns are not copied and share their data with the
+    input data frame.
+
+    Args:
+        df (DataFrame): Data frame to reset the index of.
+
+    Returns:
+        DataFrame: Shallow copy of the data frame with the index levels as leading columns.
+    """
+    if df.index.nlevels == 1:
+        default_names = ['index' if 'index' not in df.columns else 'level_0']
+    else:
+        default_names = [f'level_{level}' for level in range(df.index.nlevels)]
+    copy_df = df.copy(deep=False)
+    for level, (name, default_name) in enumerate(zip(df.index.names, default_names)):
+        copy_df.insert(
+            level,
+            name if name is not None else default_name,
+            df.index.get_level_values(level),
+        )
+    copy_df.index = pd.RangeIndex(len(copy_df))
+    return copy_df
+
@@ -1,8 +1,510 @@
+from functools import lru_cache
+from io import RawIOBase
+from mage_ai.data_cleaner.shared.utils import clean_name
 from mage_ai.io.base import BaseSQL, QUERY_ROW_LIMIT
+from mage_ai.io.export_utils import (
+    LazyDtypes,
+    PandasTypes,
+    clean_df_for_export,
+    reset_index_shallow,
+)
 from mage_ai.io.io_config import IOConfigKeys
-from pandas import DataFrame, read_sql
+from numbers import Number
+from numpyencoder import NumpyEncoder
+from pandas import DataFrame, Series, read_sql
+from pandas.api.types import (
+    is_categorical_dtype,
+    is_object_dtype,
+    is_period_dtype,
+    is_timedelta64_dtype,
+)
+from psycopg2 import sql
+from queue import Full, Queue
 from sqlalchemy import create_engine
-from typing import Any, Mapping
+from sqlalchemy.dialects import postgresql
+from threading import Event, Thread
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Tuple
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import struct
+
+EncodedColumn = Tuple[np.ndarray, np.ndarray]
+
+COPY_CHUNK_SIZE = 50_000
+COPY_PREFETCH_CHUNKS = 2
+COPY_READ_SIZE = 1 << 20
+# Variable-width COPY values of at most this many bytes on average are scattered byte by byte,
+# longer values are copied value by value
+MAX_SCATTERED_VALUE_SIZE = 16
+NAT_INT64 = np.iinfo(np.int64).min
+PG_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PG_COPY_TRAILER = struct.pack('>h', -1)
+PG_EPOCH_NS = pd.Timestamp('2000-01-01').value
+PG_EPOCH_ORDINAL = pd.Timestamp('2000-01-01').toordinal()
+# Keyword arguments of `DataFrame.to_sql` which are supported by `Postgres.export`
+PG_EXPORT_KWARGS = frozenset(['chunksize', 'dtype', 'schema'])
+# Data types of the columns that are changed by `Postgres.clean`
+PG_CLEANED_DTYPES = frozenset(
+    [
+        PandasTypes.CATEGORICAL,
+        PandasTypes.PERIOD,
+        PandasTypes.TIMEDELTA,
+        PandasTypes.TIMEDELTA64,
+    ]
+)
+# PostgreSQL integer types which can hold every value of integer dtypes narrower than 64 bits,
+# keyed by dtype kind and item size. Unsigned dtypes are promoted to the next larger type.
+PG_INTEGER_TYPES = {
+    ('i', 1): 'smallint',
+    ('i', 2): 'smallint',
+    ('i', 4): 'integer',
+    ('u', 1): 'smallint',
+    ('u', 2): 'integer',
+    ('u', 4): 'bigint',
+}
+
+
+def _fixed_width_encoder(fmt: str, convert: Callable[[Any], Any]) -> Callable[[Any], bytes]:
+    pack = struct.Struct(f'>{fmt}').pack
+    return lambda value: pack(convert(value))
+
+
+def _to_bool(value: Any) -> bool:
+    # `bool` would export any other value, such as the string 'false', as true
+    if not isinstance(value, (bool, np.bool_)):
+        raise ValueError(
+            f'Cannot export {value!r} of type \'{type(value).__name__}\' as a boolean.'
+        )
+    return bool(value)
+
+
+def _to_integer(value: Any) -> int:
+    integer = int(value)
+    # `int` would truncate fractional numbers which PostgreSQL rounds or rejects
+    if isinstance(value, Number) and integer != value:
+        raise ValueError(f'Cannot export {value!r} as an integer.')
+    return integer
+
+
+def _to_json(value: Any) -> bytes:
+    return json.dumps(value, cls=NumpyEncoder).encode('utf-8')
+
+
+def _to_text(value: Any) -> bytes:
+    return (value if isinstance(value, str) else str(value)).encode('utf-8')
+
+
+def _to_time(value: Any) -> int:
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+
+
+def _to_timestamp(value: Any) -> int:
+    return (pd.Timestamp(value).value - PG_EPOCH_NS) // 1000
+
+
+def _may_need_cleaning(dtype: Any) -> bool:
+    # Columns of any other dtype are never inferred as one of `PG_CLEANED_DTYPES`
+    return (
+        is_object_dtype(dtype)
+        or is_categorical_dtype(dtype)
+        or is_period_dtype(dtype)
+        or is_timedelta64_dtype(dtype)
+    )
+
+
+@lru_cache(maxsize=128)
+def _type_for_dtype(dtype: str, tz_aware: bool) -> str:
+    # Maps inferred data types whose PostgreSQL data type doesn't depend on the column values
+    if dtype in (PandasTypes.DATETIME, PandasTypes.DATETIME64):
+        return 'timestamptz' if tz_aware else 'timestamp'
+    elif dtype == PandasTypes.TIME:
+        return 'time'
+    elif dtype == PandasTypes.DATE:
+        return 'date'
+    elif dtype in (PandasTypes.STRING, PandasTypes.CATEGORICAL, PandasTypes.EMPTY):
+        return 'text'
+    elif dtype == PandasTypes.BYTES:
+        return 'bytea'
+    elif dtype in (
+        PandasTypes.FLOATING,
+        PandasTypes.DECIMAL,
+        PandasTypes.MIXED_INTEGER_FLOAT,
+    ):
+        return 'double precision'
+    elif dtype == PandasTypes.BOOLEAN:
+        return 'boolean'
+    elif dtype in (PandasTypes.TIMEDELTA, PandasTypes.TIMEDELTA64, PandasTypes.PERIOD):
+        return 'bigint'
+    elif dtype in (PandasTypes.MIXED, PandasTypes.MIXED_INTEGER, PandasTypes.UNKNOWN_ARRAY):
+        return 'jsonb'
+    raise ValueError(f'Invalid data type provided: \'{dtype}\'')
+
+
+def _is_null(value: Any) -> bool:
+    return (
+        value is None
+        or value is pd.NA
+        or value is pd.NaT
+        or (isinstance(value, (float, np.floating)) and np.isnan(value))
+    )
+
+
+def _value_encoder(encode_value: Callable[[Any], bytes]) -> Callable[[Series], EncodedColumn]:
+    def encode(column: Series) -> EncodedColumn:
+        lengths = []
+        values = []
+        for value in column:
+            if _is_null(value):
+                lengths.append(-1)
+            else:
+                data = encode_value(value)
+                lengths.append(len(data))
+                values.append(data)
+        return np.array(lengths, dtype=np.int32), np.frombuffer(b''.join(values), dtype=np.uint8)
+
+    return encode
+
+
+def _numeric_encoder(fmt: str, convert: Callable[[Any], Any]) -> Callable[[Series], EncodedColumn]:
+    dtype = np.dtype(f'>{fmt}')
+    encode_values = _value_encoder(_fixed_width_encoder(fmt, convert))
+
+    def out_of_range(column: Series) -> ValueError:
+        return ValueError(
+            f'Column \'{column.name}\' has values out of range for {dtype.itemsize * 8}-bit '
+            'integers.'
+        )
+
+    def encode(column: Series) -> EncodedColumn:
+        if column.dtype.kind not in 'biuf':
+            try:
+                return encode_values(column)
+            except struct.error:
+                raise out_of_range(column)
+        elif dtype.kind == 'b' and column.dtype.kind != 'b':
+            raise ValueError(
+                f'Cannot export column \'{column.name}\' with dtype \'{column.dtype}\' as booleans.'
+            )
+        null = column.isna().to_numpy()
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy()
+        else:
+            values = column.to_numpy(dtype=column.dtype.numpy_dtype, na_value=0)
+        if null.any():
+            values = values[~null]
+        if dtype.kind == 'i' and len(values):
+            if values.dtype.kind == 'f' and (values != np.trunc(values)).any():
+                raise ValueError(
+                    f'Column \'{column.name}\' has fractional values which cannot be exported '
+                    'as integers.'
+                )
+            bounds = np.iinfo(dtype)
+            if values.min() < bounds.min or values.max() > bounds.max:
+                raise out_of_range(column)
+        lengths = np.where(null, -1, dtype.itemsize).astype(np.int32)
+        return lengths, values.astype(dtype).view(np.uint8)
+
+    return encode
+
+
+def _datetime_encoder(
+    unit: str,
+    convert: Callable[[Any], Any],
+    wall_time: bool = False,
+) -> Callable[[Series], EncodedColumn]:
+    fmt = 'i' if unit == 'D' else 'q'
+    dtype = np.dtype(f'>{fmt}')
+    epoch = np.datetime64('2000-01-01', unit)
+    encode_values = _value_encoder(_fixed_width_encoder(fmt, convert))
+
+    def encode(column: Series) -> EncodedColumn:
+        if column.dtype.kind != 'M':
+            return encode_values(column)
+        if column.dt.tz is not None:
+            column = column.dt.tz_localize(None) if wall_time else column.dt.tz_convert(None)
+        values = column.to_numpy()
+        null = np.isnat(values)
+        if null.any():
+            values = values[~null]
+        offsets = (values.astype(f'M8[{unit}]') - epoch).view(np.int64)
+        lengths = np.where(null, -1, dtype.itemsize).astype(np.int32)
+        return lengths, offsets.astype(dtype).view(np.uint8)
+
+    return encode
+
+
+_encode_text_values = _value_encoder(_to_text)
+
+
+def _encode_text(column: Series) -> EncodedColumn:
+    try:
+        array = pa.array(column, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _encode_text_values(column)
+    if isinstance(array, pa.ChunkedArray):
+        # Columns backed by several pyarrow chunks, for example after `pd.concat`
+        array = array.combine_chunks()
+    _, offsets, data = array.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int32)[array.offset : array.offset + len(array) + 1]
+    lengths = np.diff(offsets)
+    if array.null_count:
+        lengths[np.asarray(array.is_null())] = -1
+    return lengths, np.frombuffer(data, dtype=np.uint8)[offsets[0] : offsets[-1]]
+
+
+# Encoders for the PostgreSQL binary COPY format, keyed by the internal name of the column type.
+# Each encoder returns the length of every field of the column (-1 for null values) and the
+# encoded non-null values of the column concatenated in row order. Numeric, boolean and datetime
+# columns are encoded with vectorized NumPy casts; any other column is encoded value by value.
+BINARY_ENCODERS = {
+    'bool': _numeric_encoder('?', _to_bool),
+    'bpchar': _encode_text,
+    'bytea': _value_encoder(bytes),
+    'date': _datetime_encoder(
+        'D', lambda value: value.toordinal() - PG_EPOCH_ORDINAL, wall_time=True
+    ),
+    'float4': _numeric_encoder('f', float),
+    'float8': _numeric_encoder('d', float),
+    'int2': _numeric_encoder('h', _to_integer),
+    'int4': _numeric_encoder('i', _to_integer),
+    'int8': _numeric_encoder('q', _to_integer),
+    'json': _value_encoder(_to_json),
+    'jsonb': _value_encoder(lambda value: b'\x01' + _to_json(value)),
+    'text': _encode_text,
+    'time': _value_encoder(_fixed_width_encoder('q', _to_time)),
+    'timestamp': _datetime_encoder('us', _to_timestamp),
+    'timestamptz': _datetime_encoder('us', _to_timestamp),
+    'varchar': _encode_text,
+}
+
+
+class BufferRing:
+    """
+    Fixed number of byte buffers which are handed out in turn, so that a buffer is only reused
+    after every other buffer of the ring has been handed out. Each buffer grows to the largest
+    size requested from it and is reused afterwards instead of allocating a new buffer.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Args:
+            size (int): Number of buffers in the ring.
+        """
+        self.buffers = [np.empty(0, dtype=np.uint8) for _ in range(size)]
+        self.position = 0
+
+    def get(self, nbytes: int) -> np.ndarray:
+        """
+        Hands out the next buffer of the ring.
+
+        Args:
+            nbytes (int): Size of the buffer in bytes.
+
+        Returns:
+            np.ndarray: Uninitialized byte array of size `nbytes`.
+        """
+        buffer = self.buffers[self.position]
+        if len(buffer) < nbytes:
+            buffer = self.buffers[self.position] = np.empty(nbytes, dtype=np.uint8)
+        self.position = (self.position + 1) % len(self.buffers)
+        return buffer[:nbytes]
+
+    def clear(self) -> None:
+        """
+        Releases the memory of all buffers of the ring.
+        """
+        self.buffers = [np.empty(0, dtype=np.uint8) for _ in self.buffers]
+
+
+def _write_fields(rows: np.ndarray, positions: np.ndarray, fields: np.ndarray) -> None:
+    # Writes fixed-width fields one byte lane at a time, so each index array has one entry per
+    # field instead of one entry per byte
+    for lane in range(fields.shape[1]):
+        rows[positions + lane] = fields[:, lane]
+
+
+def _write_values(
+    rows: np.ndarray,
+    positions: np.ndarray,
+    value_lengths: np.ndarray,
+    values: np.ndarray,
+) -> None:
+    width = value_lengths[0]
+    if width <= MAX_SCATTERED_VALUE_SIZE and (value_lengths == width).all():
+        _write_fields(rows, positions, values.reshape(-1, width))
+    elif len(values) <= MAX_SCATTERED_VALUE_SIZE * len(value_lengths):
+        # Short values are scattered byte by byte, which needs an index entry per byte
+        value_offsets = np.cumsum(value_lengths) - value_lengths
+        value_positions = np.repeat(positions - value_offsets, value_lengths)
+        value_positions += np.arange(len(values))
+        rows[value_positions] = values
+    else:
+        # Long values are copied one slice at a time without any index arrays
+        destination, source = memoryview(rows), memoryview(values)
+        value_ends = np.cumsum(value_lengths)
+        for position, start, end in zip(
+            positions.tolist(), (value_ends - value_lengths).tolist(), value_ends.tolist()
+        ):
+            destination[position : position + end - start] = source[start:end]
+
+
+def assemble_rows(
+    num_rows: int,
+    columns: List[EncodedColumn],
+    buffers: Optional[BufferRing] = None,
+) -> np.ndarray:
+    """
+    Interleaves encoded columns into rows of the PostgreSQL binary COPY format. Each row
+    consists of the 16-bit field count followed by the 32-bit length and value of each field.
+    Only the assembled rows and arrays with one entry per field are allocated, so the memory
+    used on top of the encoded columns is proportional to the size of the assembled rows.
+
+    Args:
+        num_rows (int): Number of rows to assemble.
+        columns (List[EncodedColumn]): Field lengths and concatenated values of each column.
+        buffers (BufferRing, Optional): Buffers to assemble the rows into. Defaults to None,
+        which allocates a new byte array.
+
+    Returns:
+        np.ndarray: Byte array containing the assembled rows.
+    """
+    field_sizes = [4 + np.maximum(lengths, 0, dtype=np.int64) for lengths, _ in columns]
+    row_sizes = sum(field_sizes, np.full(num_rows, 2, dtype=np.int64))
+    row_starts = np.zeros(num_rows, dtype=np.int64)
+    np.cumsum(row_sizes[:-1], out=row_starts[1:])
+
+    nbytes = int(row_sizes.sum())
+    rows = buffers.get(nbytes) if buffers is not None else np.empty(nbytes, dtype=np.uint8)
+    field_count = np.frombuffer(struct.pack('>h', len(columns)), dtype=np.uint8)
+    _write_fields(rows, row_starts, np.broadcast_to(field_count, (num_rows, 2)))
+    positions = row_starts + 2
+    for (lengths, values), field_size in zip(columns, field_sizes):
+        _write_fields(rows, positions, lengths.astype('>i4').view(np.uint8).reshape(-1, 4))
+        if len(values):
+            present = lengths > 0
+            _write_values(rows, positions[present] + 4, lengths[present], values)
+        positions += field_size
+    return rows
+
+
+def iter_binary_copy(
+    df: DataFrame,
+    encoders: List[Callable[[Series], EncodedColumn]],
+    chunk_size: int = COPY_CHUNK_SIZE,
+    buffers: Optional[BufferRing] = None,
+) -> Iterator[memoryview]:
+    """
+    Encodes the rows of a data frame in the PostgreSQL binary COPY format. Rows are encoded
+    lazily in chunks of `chunk_size` rows, so only one encoded chunk is held in memory at a time.
+    Within a chunk each column is encoded at once and the columns are then interleaved into rows.
+
+    Args:
+        df (DataFrame): Data frame to encode.
+        encoders (List[Callable[[Series], EncodedColumn]]): Column encoder for each column
+        of the data frame.
+        chunk_size (int, Optional): Number of rows to encode per chunk. Defaults to 50000.
+        buffers (BufferRing, Optional): Buffers to encode the chunks into. A chunk must be
+        consumed before its buffer is handed out again. Defaults to None, which allocates a new
+        byte array for each chunk.
+
+    Returns:
+        Iterator[memoryview]: The COPY header, each encoded chunk of rows, and the COPY trailer.
+    """
+    yield memoryview(PG_COPY_HEADER)
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start : start + chunk_size]
+        columns = [encode(chunk.iloc[:, index]) for index, encode in enumerate(encoders)]
+        yield memoryview(assemble_rows(len(chunk), columns, buffers))
+    yield memoryview(PG_COPY_TRAILER)
+
+
+def prefetch_chunks(
+    chunks: Iterator[memoryview],
+    max_pending: int = COPY_PREFETCH_CHUNKS,
+) -> Iterator[memoryview]:
+    """
+    Pulls chunks from an iterator in a background thread, so that the next chunks are produced
+    while the current chunk is consumed. At most `max_pending` chunks are held in memory at a time.
+    Exceptions raised by the iterator are re-raised to the consumer. Closing the returned iterator
+    stops the background thread.
+
+    Args:
+        chunks (Iterator[memoryview]): Iterator to pull chunks from.
+        max_pending (int, Optional): Maximum number of chunks produced ahead of the consumer.
+        Defaults to 2.
+
+    Returns:
+        Iterator[memoryview]: The chunks of the iterator in the same order.
+    """
+    pending = Queue(maxsize=max_pending)
+    cancelled = Event()
+
+    def put(item: Tuple[Optional[memoryview], Optional[Exception]]) -> bool:
+        while not cancelled.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                if not put((chunk, None)):
+                    return
+        except Exception as err:
+            put((None, err))
+        else:
+            put((None, None))
+
+    producer = Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            chunk, error = pending.get()
+            if error is not None:
+                raise error
+            elif chunk is None:
+                return
+            yield chunk
+    finally:
+        cancelled.set()
+        producer.join()
+
+
+class IteratorReader(RawIOBase):
+    """
+    Read-only file-like object which lazily pulls its contents from an iterator of byte strings.
+    Closing the reader also closes the iterator.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self.chunks = chunks
+        self.current = memoryview(b'')
+
+    def close(self) -> None:
+        if not self.closed:
+            close_chunks = getattr(self.chunks, 'close', None)
+            if close_chunks is not None:
+                close_chunks()
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:
+        while not self.current:
+            try:
+                self.current = memoryview(next(self.chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self.current))
+        buffer[:size] = self.current[:size]
+        self.current = self.current[size:]
+        return size
 
 
 class Postgres(BaseSQL):
@@ -34,8 +536,19 @@ class Postgres(BaseSQL):
         self.dburl = (
             f'postgresql+psycopg2://{user}:{password}@{host}{":"+port if port else ""}/{dbname}'
         )
+        # Encoded chunks are queued ahead of the chunk being sent, so the ring has a buffer for
+        # each queued chunk, the chunk being sent and the chunk being encoded
+        self._copy_buffers = BufferRing(COPY_PREFETCH_CHUNKS + 2)
         super().__init__(verbose=verbose, **kwargs)
 
+    def close(self) -> None:
+        """
+        Closes the connection to the PostgreSQL database and releases the buffers used to
+        export data frames.
+        """
+        self._copy_buffers.clear()
+        super().close()
+
     def open(self) -> None:
         """
         Opens a connection to the PostgreSQL database specified by the parameters.
@@ -73,25 +586,255 @@ class Postgres(BaseSQL):
             return read_sql(self._enforce_limit(query_string, limit), self.conn, **kwargs)
 
     def export(
-        self, df: DataFrame, name: str, index: bool = False, if_exists: str = 'replace', **kwargs
+        self,
+        df: DataFrame,
+        name: str,
+        index: bool = False,
+        if_exists: str = 'replace',
+        **kwargs,
     ) -> None:
         """
-        Exports dataframe to the connected database from a Pandas data frame.  If table doesn't
-        exist, the table is automatically created.
+        Exports dataframe to the connected database from a Pandas data frame. If table doesn't
+        exist, the table is automatically created with column names cleaned by `clean_name`. Columns
+        of an existing table are matched by the column name, or else by the cleaned column name.
+        Rows are sent to the database using the binary format of `COPY FROM STDIN`, so values must
+        be compatible with the column types of the table. Rows are encoded in a background thread
+        while previously encoded rows are sent to the database.
 
         Args:
-            name (str): Name of the table to insert rows from this data frame into.
+            name (str): Name of the table to insert rows from this data frame into. The name is
+            quoted, so it is case-sensitive and cannot be qualified with a schema. The table is
+            looked up and created in the current schema of the connection unless `schema` is
+            given.
             index (bool): If true, the data frame index is also exported alongside the table. Defaults to False.
             if_exists (str): Specifies export policy if table exists. Either
                 - `'fail'`: throw an error.
                 - `'replace'`: drops existing table and creates new table of same name.
                 - `'append'`: appends data frame to existing table. In this case the schema must match the original table.
             Defaults to `'replace'`.
-            **kwargs: Additional query parameters.
+            **kwargs: Additional export settings, with the same meaning as in `DataFrame.to_sql`:
+                - `schema` (str): Schema of the table. Defaults to the current schema.
+                - `chunksize` (int): Number of rows encoded and sent at a time. Defaults to 50000.
+                - `dtype` (dict or scalar): PostgreSQL data type, either as a string or as a
+                  SQLAlchemy type, of each column or of all columns. Only used when the table is
+                  created. Defaults to the data type inferred from each column.
+            Any other setting raises a `ValueError`.
         """
+        if if_exists not in ('fail', 'replace', 'append'):
+            raise ValueError(
+                f'Invalid policy specified for handling existence of table: \'{if_exists}\''
+            )
+        unsupported_kwargs = set(kwargs) - PG_EXPORT_KWARGS
+        if unsupported_kwargs:
+            raise ValueError(
+                f'Unsupported export settings: {", ".join(sorted(unsupported_kwargs))}. '
+                f'Supported settings are: {", ".join(sorted(PG_EXPORT_KWARGS))}.'
+            )
+
         with self.printer.print_msg(f'Exporting data frame to table \'{name}\''):
-            df.to_sql(name, self.conn, index=index, if_exists=if_exists, **kwargs)
-        df.to_sql(name, self.conn, index=index, if_exists=if_exists, **kwargs)
+            if index:
+                df = reset_index_shallow(df)
+            db_type_overrides = kwargs.get('dtype') or {}
+            if not isinstance(db_type_overrides, Mapping):
+                db_type_overrides = {column: db_type_overrides for column in df.columns}
+            for column in db_type_overrides:
+                if column not in df.columns:
+                    raise ValueError(f'Cannot set the data type of missing column \'{column}\'.')
+            # Data types are only inferred for columns which may be cleaned, and for all columns
+            # once the table needs to be created
+            dtypes = LazyDtypes(df)
+            df = clean_df_for_export(
+                df,
+                self.clean,
+                {
+                    column: dtypes[column]
+                    for column, dtype in df.dtypes.items()
+                    if _may_need_cleaning(dtype)
+                },
+                dtypes_to_clean=PG_CLEANED_DTYPES,
+            )
+            names = [str(column) for column in df.columns]
+
+            connection = self.conn.connection
+            try:
+                with connection.cursor() as cur:
+                    schema = kwargs.get('schema') or self.__get_current_schema(cur)
+                    table = sql.Identifier(schema, name)
+                    table_exists = self.__table_exists(cur, schema, name)
+                    if table_exists:
+                        if if_exists == 'fail':
+                            raise ValueError(f'Table \'{name}\' already exists in database.')
+                        elif if_exists == 'replace':
+                            cur.execute(sql.SQL('DROP TABLE {}').format(table))
+                            table_exists = False
+                    if not table_exists:
+                        columns = [clean_name(name) for name in names]
+                        db_dtypes = self.__get_table_types(df, dtypes, db_type_overrides)
+                        column_definitions = sql.SQL(',').join(
+                            sql.SQL('{} {}').format(sql.Identifier(column), sql.SQL(db_type))
+                            for column, db_type in zip(columns, db_dtypes.values())
+                        )
+                        cur.execute(
+                            sql.SQL('CREATE TABLE {} ({})').format(table, column_definitions)
+                        )
+
+                    column_types = self.__get_column_types(cur, schema, name)
+                    if table_exists:
+                        # Tables created by the previous `to_sql` export kept the original names
+                        columns = [
+                            column if column in column_types else clean_name(column)
+                            for column in names
+                        ]
+                    encoders = []
+                    for column in columns:
+                        if column not in column_types:
+                            raise ValueError(
+                                f'Column \'{column}\' does not exist in table \'{name}\'.'
+                            )
+                        if column_types[column] not in BINARY_ENCODERS:
+                            raise ValueError(
+                                f'Cannot export to column \'{column}\' with data type '
+                                f'\'{column_types[column]}\'.'
+                            )
+                        encoders.append(BINARY_ENCODERS[column_types[column]])
+
+                    # The reader is closed before the transaction ends, which stops the thread
+                    # encoding rows into the shared COPY buffers
+                    with IteratorReader(
+                        prefetch_chunks(
+                            iter_binary_copy(
+                                df,
+                                encoders,
+                                chunk_size=kwargs.get('chunksize') or COPY_CHUNK_SIZE,
+                                buffers=self._copy_buffers,
+                            )
+                        )
+                    ) as reader:
+                        cur.copy_expert(
+                            sql.SQL('COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)').format(
+                                table, sql.SQL(',').join(map(sql.Identifier, columns))
+                            ),
+                            reader,
+                            size=COPY_READ_SIZE,
+                        )
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+
+    def clean(self, df: DataFrame, dtype: str) -> DataFrame:
+        """
+        Cleans a group of columns sharing the same inferred data type before export so that
+        their values can be stored in PostgreSQL.
+
+        Args:
+            df (DataFrame): Columns to clean.
+            dtype (str): Inferred data type of the columns.
+
+        Returns:
+            DataFrame: Cleaned columns.
+        """
+        if dtype == PandasTypes.CATEGORICAL:
+            return df.astype(str).where(df.notna())
+        elif dtype == PandasTypes.TIMEDELTA64:
+            to_int64 = lambda column: column.to_numpy().view('int64')
+        elif dtype == PandasTypes.TIMEDELTA:
+            to_int64 = lambda column: pd.to_timedelta(column).to_numpy().view('int64')
+        elif dtype == PandasTypes.PERIOD:
+            to_int64 = lambda column: (
+                column.array.asi8 if is_period_dtype(column.dtype) else pd.PeriodIndex(column).asi8
+            )
+        else:
+            return df
+        cleaned_columns = {}
+        for column in df.columns:
+            values = to_int64(df[column])
+            cleaned_columns[column] = pd.arrays.IntegerArray(values, values == NAT_INT64)
+        return DataFrame(cleaned_columns, index=df.index, copy=False)
+
+    def get_type(self, column: Series, dtype: str) -> str:
+        """
+        Maps the inferred data type of a column to a PostgreSQL data type.
+
+        Args:
+            column (Series): Column to get the PostgreSQL data type for.
+            dtype (str): Inferred data type of the column.
+
+        Returns:
+            str: PostgreSQL data type for the column.
+        """
+        if dtype in (PandasTypes.COMPLEX, PandasTypes.INTERVAL):
+            raise ValueError(
+                f'Cannot convert column \'{column.name}\' with data type \'{dtype}\' '
+                'to a PostgreSQL data type.'
+            )
+        elif dtype == PandasTypes.INTEGER:
+            if column.dtype.kind in 'iu':
+                pg_type = PG_INTEGER_TYPES.get((column.dtype.kind, column.dtype.itemsize))
+                if pg_type is not None:
+                    return pg_type
+            values = self.__get_integer_values(column)
+            if not len(values):
+                return 'bigint'
+            min_int, max_int = values.min(), values.max()
+            if -32768 <= min_int and max_int <= 32767:
+                return 'smallint'
+            elif -2147483648 <= min_int and max_int <= 2147483647:
+                return 'integer'
+            else:
+                return 'bigint'
+        elif dtype in (PandasTypes.DATETIME, PandasTypes.DATETIME64):
+            return _type_for_dtype(dtype, getattr(column.dtype, 'tz', None) is not None)
+        return _type_for_dtype(dtype, False)
+
+    def __get_table_types(
+        self,
+        df: DataFrame,
+        dtypes: Mapping[str, str],
+        db_type_overrides: Mapping[str, Any],
+    ) -> Mapping[str, str]:
+        db_dtypes = {}
+        for column in df.columns:
+            if column in db_type_overrides:
+                db_type = db_type_overrides[column]
+                if isinstance(db_type, type):
+                    db_type = db_type()
+                if not isinstance(db_type, str):
+                    db_type = db_type.compile(dialect=postgresql.dialect())
+                db_dtypes[column] = db_type
+            else:
+                db_dtypes[column] = self.get_type(df[column], dtypes[column])
+        return db_dtypes
+
+    def __get_integer_values(self, column: Series) -> np.ndarray:
+        array = column.array
+        if isinstance(array, pd.arrays.IntegerArray):
+            return array._data[~array._mask] if array._mask.any() else array._data
+        elif is_object_dtype(column.dtype):
+            return column.dropna().to_numpy()
+        return column.to_numpy()
+
+    def __get_column_types(self, cursor: Any, schema: str, table_name: str) -> Mapping[str, str]:
+        cursor.execute(
+            'SELECT column_name, udt_name FROM information_schema.columns '
+            'WHERE table_schema = %s AND table_name = %s',
+            (schema, table_name),
+        )
+        return dict(cursor.fetchall())
+
+    def __get_current_schema(self, cursor: Any) -> str:
+        cursor.execute('SELECT current_schema()')
+        schema = cursor.fetchone()[0]
+        if schema is None:
+            raise ValueError('No schema has been selected to export the data frame into.')
+        return schema
+
+    def __table_exists(self, cursor: Any, schema: str, table_name: str) -> bool:
+        cursor.execute(
+            'SELECT 1 FROM pg_tables WHERE schemaname = %s AND tablename = %s LIMIT 1',
+            (schema, table_name),
+        )
+        return cursor.fetchone() is not None
 
     @classmethod
     def with_config(cls, config: Mapping[str, Any]) -> 'Postgres':
@@ -0,0 +1,131 @@
+from mage_ai.io.export_utils import (
+    LazyDtypes,
+    PandasTypes,
+    clean_df_for_export,
+    infer_dtypes,
+    reset_index_shallow,
+)
+from mage_ai.tests.base_test import TestCase
+import pandas as pd
+import numpy as np
+
+
+class ExportUtilsTests(TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                'integers': [1, 2, 3],
+                'floats': [1.5, np.nan, 3.0],
+                'strings': ['a', None, 'c'],
+                'categories': pd.Series(['x', 'y', 'x'], dtype='category'),
+                'timestamps': pd.date_range('2022-01-01', periods=3),
+                'timedeltas': pd.to_timedelta([1, 2, 3], unit='s'),
+            }
+        )
+        return super().setUp()
+
+    def test_infer_dtypes(self):
+        self.assertEqual(
+            infer_dtypes(self.df),
+            {
+                'integers': PandasTypes.INTEGER,
+                'floats': PandasTypes.FLOATING,
+                'strings': PandasTypes.STRING,
+                'categories': PandasTypes.CATEGORICAL,
+                'timestamps': PandasTypes.DATETIME64,
+                'timedeltas': PandasTypes.TIMEDELTA64,
+            },
+        )
+
+    def test_infer_dtypes_object_columns(self):
+        df = pd.DataFrame(
+            {
+                'strings': [None, 'a', 'b'],
+                'mixed': ['a', 1, None],
+                'nulls': [None, None, None],
+                'nullable_strings': pd.Series(['a', None, 'c'], dtype='string'),
+            }
+        )
+        self.assertEqual(
+            infer_dtypes(df),
+            {
+                'strings': PandasTypes.STRING,
+                'mixed': PandasTypes.MIXED_INTEGER,
+                'nulls': PandasTypes.EMPTY,
+                'nullable_strings': PandasTypes.STRING,
+            },
+        )
+
+    def test_lazy_dtypes(self):
+        dtypes = LazyDtypes(self.df)
+        self.assertEqual(dict(dtypes), {})
+        self.assertEqual(dtypes['strings'], PandasTypes.STRING)
+        self.assertEqual(dtypes['timedeltas'], PandasTypes.TIMEDELTA64)
+        self.assertEqual(
+            dict(dtypes),
+            {'strings': PandasTypes.STRING, 'timedeltas': PandasTypes.TIMEDELTA64},
+        )
+        self.assertEqual({column: dtypes[column] for column in self.df}, infer_dtypes(self.df))
+
+    def test_clean_df_for_export(self):
+        def column_mapper(df, dtype):
+            if dtype == PandasTypes.CATEGORICAL:
+                return df.astype(str)
+            return df
+
+        cleaned_df = clean_df_for_export(self.df, column_mapper, infer_dtypes(self.df))
+        self.assertEqual(cleaned_df['categories'].dtype, np.dtype('object'))
+        self.assertEqual(cleaned_df['categories'].tolist(), ['x', 'y', 'x'])
+        self.assertEqual(cleaned_df.columns.tolist(), self.df.columns.tolist())
+        self.assertEqual(self.df['categories'].dtype, 'category')
+        pd.testing.assert_frame_equal(
+            cleaned_df.drop(columns=['categories']),
+            self.df.drop(columns=['categories']),
+        )
+
+    def test_clean_df_for_export_dtypes_to_clean(self):
+        cleaned_dtypes = []
+
+        def column_mapper(df, dtype):
+            cleaned_dtypes.append(dtype)
+            return df.astype(str)
+
+        cleaned_df = clean_df_for_export(
+            self.df,
+            column_mapper,
+            infer_dtypes(self.df),
+            dtypes_to_clean=[PandasTypes.CATEGORICAL],
+        )
+        self.assertEqual(cleaned_dtypes, [PandasTypes.CATEGORICAL])
+        self.assertEqual(cleaned_df['categories'].dtype, np.dtype('object'))
+        self.assertEqual(self.df['categories'].dtype, 'category')
+        self.assertTrue(np.shares_memory(cleaned_df['floats'].values, self.df['floats'].values))
+
+    def test_clean_df_for_export_column_labels(self):
+        df = pd.DataFrame({0: [1, 2], 'categories': pd.Series(['x', 'y'], dtype='category')})
+        df.index = ['a', 'b']
+        cleaned_df = clean_df_for_export(
+            df,
+            lambda df, dtype: df.astype(str),
+            infer_dtypes(df),
+            dtypes_to_clean=[PandasTypes.CATEGORICAL],
+        )
+        self.assertEqual(cleaned_df.columns.tolist(), [0, 'categories'])
+        self.assertEqual(cleaned_df.index.tolist(), ['a', 'b'])
+        self.assertEqual(cleaned_df[0].tolist(), [1, 2])
+        self.assertEqual(cleaned_df['categories'].tolist(), ['x', 'y'])
+
+    def test_reset_index_shallow(self):
+        df = self.df.set_index('integers')
+        pd.testing.assert_frame_equal(reset_index_shallow(df), df.reset_index())
+        self.assertTrue(
+            np.shares_memory(reset_index_shallow(df)['floats'].values, df['floats'].values)
+        )
+
+        df = pd.DataFrame(
+            {'index': [1, 2], 'values': [3, 4]},
+            index=pd.MultiIndex.from_tuples([(1, 'x'), (2, 'y')]),
+        )
+        pd.testing.assert_frame_equal(reset_index_shallow(df), df.reset_index())
+        df = pd.DataFrame({'index': [1, 2]}, index=[5, 6])
+        pd.testing.assert_frame_equal(reset_index_shallow(df), df.reset_index())
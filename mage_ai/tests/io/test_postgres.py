@@ -0,0 +1,599 @@
+from mage_ai.io.export_utils import PandasTypes
+from mage_ai.io.postgres import (
+    BINARY_ENCODERS,
+    BufferRing,
+    PG_COPY_HEADER,
+    PG_COPY_TRAILER,
+    IteratorReader,
+    Postgres,
+    assemble_rows,
+    iter_binary_copy,
+    prefetch_chunks,
+)
+from mage_ai.tests.base_test import TestCase
+from psycopg2 import sql
+from unittest.mock import MagicMock, patch
+import datetime
+import json
+import pandas as pd
+import numpy as np
+import re
+import sqlalchemy
+import struct
+import threading
+import warnings
+
+PG_TYPES = {
+    'bigint': 'int8',
+    'boolean': 'bool',
+    'bytea': 'bytea',
+    'date': 'date',
+    'double precision': 'float8',
+    'integer': 'int4',
+    'jsonb': 'jsonb',
+    'smallint': 'int2',
+    'text': 'text',
+    'TEXT': 'text',
+    'time': 'time',
+    'timestamp': 'timestamp',
+    'timestamptz': 'timestamptz',
+}
+PG_DECODERS = {
+    'bool': lambda data: struct.unpack('>?', data)[0],
+    'bytea': bytes,
+    'date': lambda data: datetime.date(2000, 1, 1)
+    + datetime.timedelta(days=struct.unpack('>i', data)[0]),
+    'float4': lambda data: struct.unpack('>f', data)[0],
+    'float8': lambda data: struct.unpack('>d', data)[0],
+    'int2': lambda data: struct.unpack('>h', data)[0],
+    'int4': lambda data: struct.unpack('>i', data)[0],
+    'int8': lambda data: struct.unpack('>q', data)[0],
+    'jsonb': lambda data: json.loads(data[1:]),
+    'text': lambda data: data.decode('utf-8'),
+    'timestamp': lambda data: pd.Timestamp('2000-01-01')
+    + pd.Timedelta(microseconds=struct.unpack('>q', data)[0]),
+}
+
+
+def render_query(query):
+    if isinstance(query, sql.Composed):
+        return ''.join(render_query(part) for part in query.seq)
+    elif isinstance(query, sql.SQL):
+        return query.string
+    elif isinstance(query, sql.Identifier):
+        return '.'.join('"' + string.replace('"', '""') + '"' for string in query.strings)
+    return query
+
+
+def parse_identifiers(query):
+    return [name.replace('""', '"') for name in re.findall(r'"((?:[^"]|"")*)"', query)]
+
+
+def decode_binary_copy(data, udt_names):
+    assert data.startswith(PG_COPY_HEADER) and data.endswith(PG_COPY_TRAILER)
+    rows = []
+    position = len(PG_COPY_HEADER)
+    while position < len(data) - len(PG_COPY_TRAILER):
+        (field_count,) = struct.unpack_from('>h', data, position)
+        assert field_count == len(udt_names)
+        position += 2
+        row = []
+        for udt_name in udt_names:
+            (length,) = struct.unpack_from('>i', data, position)
+            position += 4
+            if length == -1:
+                row.append(None)
+            else:
+                row.append(PG_DECODERS[udt_name](data[position : position + length]))
+                position += length
+        rows.append(tuple(row))
+    return rows
+
+
+class FakeCursor:
+    """
+    Cursor of a fake PostgreSQL database which handles the statements issued by
+    `Postgres.export` and decodes the rows copied into its tables.
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self.results = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, query, params=None):
+        query = render_query(query)
+        self.database.queries.append(query)
+        tables = self.database.tables
+        if query == 'SELECT current_schema()':
+            self.results = [(self.database.schema,)]
+        elif query.startswith('SELECT 1 FROM pg_tables'):
+            self.results = [(1,)] if tuple(params) in tables else []
+        elif query.startswith('SELECT column_name, udt_name'):
+            self.results = list(tables.get(tuple(params), {}).items())
+        elif query.startswith('DROP TABLE'):
+            del tables[tuple(parse_identifiers(query))]
+            del self.database.rows[tuple(parse_identifiers(query))]
+        elif query.startswith('CREATE TABLE'):
+            definitions = re.findall(r'("(?:[^"]|"")*") ([A-Za-z ]+)', query.split('(', 1)[1])
+            table = tuple(parse_identifiers(query.split('(', 1)[0]))
+            tables[table] = {
+                parse_identifiers(column)[0]: PG_TYPES[db_type] for column, db_type in definitions
+            }
+            self.database.rows[table] = []
+        else:
+            raise ValueError(f'Unexpected query: {query}')
+
+    def fetchone(self):
+        return self.results[0] if self.results else None
+
+    def fetchall(self):
+        return self.results
+
+    def copy_expert(self, query, file, size=8192):
+        query = render_query(query)
+        self.database.queries.append(query)
+        table_query, columns_query = query.split('(', 1)
+        table = tuple(parse_identifiers(table_query))
+        columns = parse_identifiers(columns_query)
+        udt_names = [self.database.tables[table][column] for column in columns]
+        self.database.rows[table].extend(decode_binary_copy(file.read(), udt_names))
+
+
+class FakeDatabase:
+    def __init__(self, schema='public'):
+        self.schema = schema
+        self.tables = {}
+        self.rows = {}
+        self.queries = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakeQueryConnection:
+    """
+    DB-API connection returning fixed rows decoded the way psycopg2 decodes them.
+    """
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+        self.queries = []
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            description = [(column,) for column in self.columns]
+
+            def execute(self, query, *args):
+                connection.queries.append(query)
+
+            def fetchall(self):
+                return connection.rows
+
+            def close(self):
+                pass
+
+        return Cursor()
+
+    def close(self):
+        pass
+
+
+class PostgresTests(TestCase):
+    def setUp(self):
+        self.loader = Postgres('dbname', 'user', 'password', 'host', verbose=False)
+        self.database = FakeDatabase()
+        self.loader._ctx = MagicMock(connection=self.database)
+        return super().setUp()
+
+    def test_load(self):
+        timestamp = datetime.datetime(2022, 1, 1, 12, tzinfo=datetime.timezone.utc)
+        columns = ['nulls', 'strings', 'booleans', 'timestamps', 'dates', 'documents']
+        rows = [
+            (None, '', True, timestamp, datetime.date(9999, 12, 31), {'a': [1, 2]}),
+            (None, None, False, None, datetime.date(2022, 1, 1), None),
+        ]
+        self.loader._ctx = FakeQueryConnection(columns, rows)
+        with warnings.catch_warnings():
+            # pandas warns that the fake connection is not a SQLAlchemy connectable
+            warnings.simplefilter('ignore', UserWarning)
+            df = self.loader.load('SELECT * FROM table', limit=10)
+        self.assertEqual(
+            self.loader._ctx.queries,
+            [self.loader._enforce_limit('SELECT * FROM table', 10)],
+        )
+        self.assertEqual(df.columns.tolist(), columns)
+        self.assertEqual(df['nulls'].tolist(), [None, None])
+        self.assertEqual(df['strings'].tolist(), ['', None])
+        self.assertEqual(df['booleans'].tolist(), [True, False])
+        self.assertEqual(df['timestamps'][0], timestamp)
+        self.assertTrue(pd.isna(df['timestamps'][1]))
+        self.assertEqual(
+            df['dates'].tolist(),
+            [datetime.date(9999, 12, 31), datetime.date(2022, 1, 1)],
+        )
+        self.assertEqual(df['documents'].tolist(), [{'a': [1, 2]}, None])
+
+    def test_export_create_table(self):
+        df = pd.DataFrame({'user': [1, 2], 'order': ['x', None], 'Mixed Case': [1.5, 2.5]})
+        self.loader.export(df, 'Table"Name')
+        self.assertIn(
+            'CREATE TABLE "public"."Table""Name" '
+            '("user" smallint,"order" text,"mixed_case" double precision)',
+            self.database.queries,
+        )
+        self.assertEqual(
+            self.database.rows[('public', 'Table"Name')],
+            [(1, 'x', 1.5), (2, None, 2.5)],
+        )
+        self.assertEqual((self.database.commits, self.database.rollbacks), (1, 0))
+
+    def test_export_table_types(self):
+        df = pd.DataFrame(
+            {
+                'small': np.array([1, -2], dtype='int64'),
+                'medium': np.array([1, 40000], dtype='int64'),
+                'large': np.array([1, 2**40], dtype='int64'),
+                'unsigned': np.array([1, 2**40], dtype='uint64'),
+                'nullable': pd.array([None, 40000], dtype='Int64'),
+                'nulls': pd.array([None, None], dtype='Int64'),
+                'narrow': np.array([1, 2], dtype='int32'),
+            }
+        )
+        self.loader.export(df, 'table')
+        self.assertEqual(
+            self.database.tables[('public', 'table')],
+            {
+                'small': 'int2',
+                'medium': 'int4',
+                'large': 'int8',
+                'unsigned': 'int8',
+                'nullable': 'int4',
+                'nulls': 'int8',
+                'narrow': 'int4',
+            },
+        )
+        self.assertEqual(
+            self.database.rows[('public', 'table')],
+            [(1, 1, 1, 1, None, None, 1), (-2, 40000, 2**40, 2**40, 40000, None, 2)],
+        )
+
+    def test_export_if_exists(self):
+        def reset_table():
+            self.database.tables[('public', 'table')] = {'value': 'int8'}
+            self.database.rows[('public', 'table')] = [(5,)]
+
+        df = pd.DataFrame({'value': [1]})
+        reset_table()
+        with self.assertRaises(ValueError):
+            self.loader.export(df, 'table', if_exists='fail')
+        self.assertEqual(self.database.rows[('public', 'table')], [(5,)])
+        self.assertEqual((self.database.commits, self.database.rollbacks), (0, 1))
+
+        self.loader.export(df, 'table', if_exists='append')
+        self.assertEqual(self.database.tables[('public', 'table')], {'value': 'int8'})
+        self.assertEqual(self.database.rows[('public', 'table')], [(5,), (1,)])
+
+        reset_table()
+        self.loader.export(df, 'table', if_exists='replace')
+        self.assertIn('DROP TABLE "public"."table"', self.database.queries)
+        self.assertEqual(self.database.tables[('public', 'table')], {'value': 'int2'})
+        self.assertEqual(self.database.rows[('public', 'table')], [(1,)])
+
+        with self.assertRaises(ValueError):
+            self.loader.export(df, 'table', if_exists='overwrite')
+
+    def test_export_encoders(self):
+        self.database.tables[('public', 'table')] = {
+            'number': 'text',
+            'text': 'text',
+            'timestamp': 'timestamp',
+        }
+        self.database.rows[('public', 'table')] = []
+        df = pd.DataFrame(
+            {
+                'number': [1, 2],
+                'text': ['a', None],
+                'timestamp': pd.to_datetime(['2000-01-01 00:00:01', None]),
+            }
+        )
+        self.loader.export(df, 'table', if_exists='append')
+        self.assertEqual(
+            self.database.rows[('public', 'table')],
+            [('1', 'a', pd.Timestamp('2000-01-01 00:00:01')), ('2', None, None)],
+        )
+
+        self.database.tables[('public', 'table')]['timestamp'] = 'numeric'
+        with self.assertRaises(ValueError):
+            self.loader.export(df, 'table', if_exists='append')
+        with self.assertRaises(ValueError):
+            self.loader.export(df.assign(missing=1), 'table', if_exists='append')
+        self.assertEqual(len(self.database.rows[('public', 'table')]), 2)
+        self.assertEqual(self.database.rollbacks, 2)
+
+    def test_export_append_column_names(self):
+        self.database.tables[('public', 'table')] = {'MyCol': 'int8', 'other_value': 'text'}
+        self.database.rows[('public', 'table')] = []
+        df = pd.DataFrame({'MyCol': [1], 'Other Value': ['a']})
+        self.loader.export(df, 'table', if_exists='append')
+        self.assertEqual(
+            self.database.queries[-1],
+            'COPY "public"."table" ("MyCol","other_value") FROM STDIN WITH (FORMAT BINARY)',
+        )
+        self.assertEqual(self.database.rows[('public', 'table')], [(1, 'a')])
+
+        self.loader.export(df, 'table', if_exists='replace')
+        self.assertEqual(
+            self.database.tables[('public', 'table')],
+            {'mycol': 'int2', 'other_value': 'text'},
+        )
+        self.assertEqual(self.database.rows[('public', 'table')], [(1, 'a')])
+
+    def test_export_kwargs(self):
+        df = pd.DataFrame({'value': [1, 2, 3], 'text': ['a', 'b', 'c']})
+        self.loader.export(
+            df,
+            'table',
+            schema='other',
+            chunksize=2,
+            dtype={'value': 'bigint', 'text': sqlalchemy.types.Text},
+        )
+        self.assertEqual(
+            self.database.tables[('other', 'table')],
+            {'value': 'int8', 'text': 'text'},
+        )
+        self.assertEqual(self.database.rows[('other', 'table')], [(1, 'a'), (2, 'b'), (3, 'c')])
+        self.assertNotIn(('public', 'table'), self.database.tables)
+
+        for kwargs in ({'method': 'multi'}, {'dtype': {'missing': 'text'}}):
+            with self.assertRaises(ValueError):
+                self.loader.export(df, 'table', **kwargs)
+
+    def test_export_current_schema(self):
+        self.database.tables[('other', 'table')] = {'value': 'text'}
+        self.database.rows[('other', 'table')] = []
+        self.database.schema = 'current'
+        self.loader.export(pd.DataFrame({'value': [1]}), 'table', if_exists='fail')
+        self.assertEqual(self.database.tables[('current', 'table')], {'value': 'int2'})
+        self.assertEqual(self.database.rows[('current', 'table')], [(1,)])
+        self.assertEqual(self.database.rows[('other', 'table')], [])
+
+    def test_get_type(self):
+        test_cases = [
+            (pd.Series([1, -2, 3]), PandasTypes.INTEGER, 'smallint'),
+            (pd.Series([1, 40000]), PandasTypes.INTEGER, 'integer'),
+            (pd.Series([1, 2**40]), PandasTypes.INTEGER, 'bigint'),
+            (pd.Series([1, None, 40000], dtype='Int64'), PandasTypes.INTEGER, 'integer'),
+            (pd.Series([1, None, -2], dtype=object), PandasTypes.INTEGER, 'smallint'),
+            (pd.Series([1, 2], dtype='int32'), PandasTypes.INTEGER, 'integer'),
+            (pd.Series([1, 2], dtype='uint16'), PandasTypes.INTEGER, 'integer'),
+            (pd.Series([1, None], dtype='Int8'), PandasTypes.INTEGER, 'smallint'),
+            (pd.Series([1.5, 2.0]), PandasTypes.FLOATING, 'double precision'),
+            (pd.Series(['a', 'b']), PandasTypes.STRING, 'text'),
+            (pd.Series([True, False]), PandasTypes.BOOLEAN, 'boolean'),
+            (pd.Series(pd.date_range('2022-01-01', periods=2)), PandasTypes.DATETIME64, 'timestamp'),
+            (
+                pd.Series(pd.date_range('2022-01-01', periods=2, tz='UTC')),
+                PandasTypes.DATETIME64,
+                'timestamptz',
+            ),
+            (pd.Series([[1], {'a': 1}]), PandasTypes.MIXED, 'jsonb'),
+        ]
+        for column, dtype, expected_type in test_cases:
+            self.assertEqual(self.loader.get_type(column, dtype), expected_type)
+
+        for dtype in (PandasTypes.COMPLEX, 'unknown'):
+            with self.assertRaises(ValueError):
+                self.loader.get_type(pd.Series([1j]), dtype)
+
+    def test_clean(self):
+        df = pd.DataFrame(
+            {
+                'first': pd.to_timedelta([1, None, 3], unit='us'),
+                'second': pd.to_timedelta([4, 5, None], unit='us'),
+            }
+        )
+        cleaned_df = self.loader.clean(df, PandasTypes.TIMEDELTA64)
+        self.assertEqual(cleaned_df['first'].tolist(), [1000, pd.NA, 3000])
+        self.assertEqual(cleaned_df['second'].tolist(), [4000, 5000, pd.NA])
+
+        df = pd.DataFrame({'categories': pd.Series(['x', None, 'y'], dtype='category')})
+        cleaned_df = self.loader.clean(df, PandasTypes.CATEGORICAL)
+        self.assertEqual(cleaned_df['categories'].tolist()[::2], ['x', 'y'])
+        self.assertTrue(pd.isna(cleaned_df['categories'][1]))
+
+    def test_iter_binary_copy(self):
+        df = pd.DataFrame(
+            {
+                'ints': [1, 2],
+                'floats': [0.5, np.nan],
+                'strings': ['é', None],
+                'timestamps': pd.to_datetime(['2000-01-01 00:00:01', None]),
+            }
+        )
+        encoders = [BINARY_ENCODERS[udt] for udt in ('int8', 'float8', 'text', 'timestamp')]
+        expected = (
+            PG_COPY_HEADER
+            + struct.pack('>hiqidi', 4, 8, 1, 8, 0.5, 2)
+            + 'é'.encode('utf-8')
+            + struct.pack('>iq', 8, 1_000_000)
+            + struct.pack('>hiqiii', 4, 8, 2, -1, -1, -1)
+            + PG_COPY_TRAILER
+        )
+        for chunk_size in (1, 2, 50_000):
+            reader = IteratorReader(iter_binary_copy(df, encoders, chunk_size=chunk_size))
+            self.assertEqual(reader.read(), expected)
+            reader = IteratorReader(
+                iter_binary_copy(df, encoders, chunk_size=chunk_size, buffers=BufferRing(1))
+            )
+            self.assertEqual(reader.read(), expected)
+
+    def test_iter_binary_copy_text(self):
+        df = pd.DataFrame(
+            {
+                'strings': ['abc', None, '', 'é'],
+                'mixed': ['a', 1, np.nan, None],
+            }
+        )
+        encoders = [BINARY_ENCODERS['text'], BINARY_ENCODERS['varchar']]
+        expected = (
+            PG_COPY_HEADER
+            + struct.pack('>hi', 2, 3)
+            + b'abc'
+            + struct.pack('>i', 1)
+            + b'a'
+            + struct.pack('>hii', 2, -1, 1)
+            + b'1'
+            + struct.pack('>hiihi', 2, 0, -1, 2, 2)
+            + 'é'.encode('utf-8')
+            + struct.pack('>i', -1)
+            + PG_COPY_TRAILER
+        )
+        reader = IteratorReader(iter_binary_copy(df, encoders, chunk_size=3))
+        self.assertEqual(reader.read(), expected)
+
+        # Concatenated pyarrow strings are backed by several chunks
+        df['strings'] = pd.concat(
+            [
+                pd.Series(['abc', None], dtype='string[pyarrow]'),
+                pd.Series(['', 'é'], dtype='string[pyarrow]'),
+            ],
+            ignore_index=True,
+        )
+        reader = IteratorReader(iter_binary_copy(df, encoders, chunk_size=3))
+        self.assertEqual(reader.read(), expected)
+
+    def test_binary_encoders_numeric(self):
+        test_cases = [
+            ('int2', pd.Series([1, None, -2], dtype='Int64'), '>h', [1, -2]),
+            ('int4', pd.Series([1.0, np.nan, 3.0]), '>i', [1, 3]),
+            ('int8', pd.Series([1, None, 2**40], dtype=object), '>q', [1, 2**40]),
+            ('float4', pd.Series([0.5, 1.5, None], dtype='float32'), '>f', [0.5, 1.5]),
+            ('float8', pd.Series([1, 2, 3]), '>d', [1.0, 2.0, 3.0]),
+            ('bool', pd.Series([True, None, False], dtype='boolean'), '>?', [True, False]),
+            ('bool', pd.Series([np.bool_(False), None, True]), '>?', [False, True]),
+        ]
+        for udt, column, fmt, expected_values in test_cases:
+            lengths, values = BINARY_ENCODERS[udt](column)
+            size = struct.calcsize(fmt)
+            self.assertEqual(lengths.tolist(), [-1 if pd.isna(v) else size for v in column])
+            self.assertEqual(values.tobytes(), b''.join(struct.pack(fmt, v) for v in expected_values))
+
+        invalid_cases = [
+            ('int2', pd.Series([1, 40000])),
+            ('int2', pd.Series([1, None, 40000], dtype=object)),
+            ('int8', pd.Series([2**63], dtype=object)),
+            ('int8', pd.Series([1.7, 2.2])),
+            ('int4', pd.Series([1, None, 2.5], dtype=object)),
+            ('bool', pd.Series(['false', 'true'])),
+            ('bool', pd.Series([0, 1])),
+        ]
+        for udt, column in invalid_cases:
+            with self.assertRaises(ValueError):
+                BINARY_ENCODERS[udt](column)
+
+    def test_prefetch_chunks(self):
+        chunks = [memoryview(bytes([value])) for value in range(10)]
+        self.assertEqual(list(prefetch_chunks(iter(chunks), max_pending=3)), chunks)
+
+        def failing_chunks():
+            yield memoryview(b'a')
+            raise ValueError('Encoding failed')
+
+        prefetched = prefetch_chunks(failing_chunks())
+        self.assertEqual(next(prefetched), b'a')
+        with self.assertRaises(ValueError):
+            next(prefetched)
+
+        prefetched = prefetch_chunks(iter(chunks), max_pending=1)
+        self.assertEqual(next(prefetched), chunks[0])
+        prefetched.close()
+
+    def test_iterator_reader_close(self):
+        closed = []
+
+        def chunks():
+            try:
+                yield b'ab'
+                yield b'cd'
+            finally:
+                closed.append(True)
+
+        with IteratorReader(chunks()) as reader:
+            self.assertEqual(reader.read(1), b'a')
+        self.assertEqual(closed, [True])
+        self.assertTrue(reader.closed)
+
+    def test_export_failed_copy(self):
+        def copy_expert(cursor, query, file, size=8192):
+            file.read(size)
+            raise ValueError('COPY failed')
+
+        thread_counts = []
+        self.database.rollback = lambda: thread_counts.append(threading.active_count())
+        df = pd.DataFrame({'value': range(100)})
+        with patch.object(FakeCursor, 'copy_expert', copy_expert):
+            with self.assertRaises(ValueError):
+                self.loader.export(df, 'table', chunksize=1)
+        # The thread encoding the rows is stopped before the transaction is rolled back
+        self.assertEqual(thread_counts, [threading.active_count()])
+
+    def test_binary_encoders_datetime(self):
+        column = pd.Series(pd.to_datetime(['2000-01-02 23:00', None]).tz_localize('US/Eastern'))
+        lengths, values = BINARY_ENCODERS['timestamptz'](column)
+        self.assertEqual(lengths.tolist(), [8, -1])
+        self.assertEqual(values.tobytes(), struct.pack('>q', (24 + 28) * 3600 * 1_000_000))
+
+        lengths, values = BINARY_ENCODERS['date'](column)
+        self.assertEqual(lengths.tolist(), [4, -1])
+        self.assertEqual(values.tobytes(), struct.pack('>i', 1))
+
+    def test_buffer_ring(self):
+        buffers = BufferRing(2)
+        first, second = buffers.get(4), buffers.get(8)
+        self.assertEqual((len(first), len(second)), (4, 8))
+        self.assertFalse(np.shares_memory(first, second))
+        self.assertTrue(np.shares_memory(buffers.get(2), first))
+        self.assertFalse(np.shares_memory(buffers.get(16), second))
+        buffers.clear()
+        self.assertEqual([len(buffer) for buffer in buffers.buffers], [0, 0])
+
+    def test_assemble_rows(self):
+        columns = [
+            ('int8', pd.Series([1, None, 3], dtype='Int64')),
+            ('text', pd.Series(['a', '', None])),
+            ('text', pd.Series(['ab', 'c', 'def'])),
+            ('text', pd.Series(['x' * 40, None, 'é' * 30])),
+            ('bytea', pd.Series([b'y' * 20, b'z' * 20, b'w' * 20])),
+        ]
+        encoded = [BINARY_ENCODERS[udt](column) for udt, column in columns]
+        expected = b''
+        for row in range(3):
+            expected += struct.pack('>h', len(columns))
+            for udt, column in columns:
+                value = column[row]
+                if pd.isna(value):
+                    expected += struct.pack('>i', -1)
+                    continue
+                if udt == 'int8':
+                    data = struct.pack('>q', value)
+                else:
+                    data = value if isinstance(value, bytes) else value.encode('utf-8')
+                expected += struct.pack('>i', len(data)) + data
+        self.assertEqual(assemble_rows(3, encoded).tobytes(), expected)